@@ -1,9 +1,28 @@
-from .glow import Glow
+import sys
+
+import colorama
+
+from .glow import fanout, helpers, messages, run
 
 
 def main():
-    glow = Glow()
-    glow.main()
+    args = helpers.parse_args()
+
+    colorama.init(autoreset=True)
+
+    if args.json:
+        messages.redirect(sys.stderr)
+
+    if args.manifest:
+        result = fanout.run_manifest(args)
+
+    else:
+        result = run(args)
+
+    if args.json:
+        result.dump()
+
+    sys.exit(result.exit_code)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,25 @@
-import errno
+import functools
 import os
 import sys
 
-import colorama
 from git import Repo
-from git.exc import InvalidGitRepositoryError
-import semver
-
-from . import helpers, integrations, messages, validators
+from git.exc import (
+    GitCommandError,
+    InvalidGitRepositoryError,
+    NoSuchPathError,
+)
+from requests import RequestException
+
+from . import (
+    helpers,
+    integrations,
+    messages,
+    models,
+    plans,
+    results,
+    settings,
+    validators,
+)
 
 
 class Glow(object):
@@ -18,8 +30,18 @@ class Glow(object):
     develop_branch = "develop"
     remote_name = "origin"
 
+    branch_kinds = ("feature", "release", "hotfix")
+
     repo = None
     config = None
+    versions = None
+    result = None
+
+    assume_yes = False
+    interactive = True
+    remote_only = False
+    plan_only = False
+    first_commit = None
 
     current_directory = None
     working_directory = None
@@ -30,7 +52,17 @@ class Glow(object):
     github_token = None
 
     def _branches(self):
-        return [branch.name for branch in self.repo.branches]
+        output = self.repo.git.for_each_ref(
+            "--format=%(refname) %(objectname)", "refs/heads"
+        )
+
+        branches = {}
+        for line in output.splitlines():
+            ref, sha = line.split(" ", 1)
+            name = ref.replace("refs/heads/", "", 1)
+            branches[name] = models.Branch.parse(name, sha)
+
+        return branches
 
     def _branch_exists(self, branch_name):
         return branch_name in self._branches()
@@ -52,6 +84,29 @@ class Glow(object):
 
         messages.success("↓ «{}» pulled.".format(branch_name))
 
+    def _local_sha(self, branch_name):
+        try:
+            return self.repo.git.rev_parse("--verify", "-q", branch_name)
+
+        except GitCommandError:
+            return None
+
+    def _start_branch(self, branch_name, base_branch, commit_sha):
+        if self._local_sha(base_branch) != commit_sha:
+            self._pull_branch(branch_name, create=True)
+            return
+
+        remote_ref = "refs/remotes/{}/{}".format(self.remote_name, branch_name)
+
+        self.repo.git.checkout("-b", branch_name, commit_sha)
+        self.repo.git.update_ref(remote_ref, commit_sha)
+        self.repo.git.branch(
+            "--set-upstream-to",
+            "{}/{}".format(self.remote_name, branch_name),
+        )
+
+        messages.success("«{}» tracks «{}».".format(branch_name, remote_ref))
+
     def _push_branch(self, branch_name, force=False):
         if force:
             self.repo.git.push(self.remote_name, branch_name, "--force")
@@ -61,9 +116,125 @@ class Glow(object):
 
         messages.info("↑ «{}» pushed.".format(branch_name))
 
+    def _sync_branch(self, branch_name, base_branch, remote_sha):
+        """Rebase a branch on its base and push it, skipping no-op steps"""
+
+        skipped = []
+
+        self._change_branch(branch_name)
+
+        merge_base = self.repo.git.merge_base(branch_name, base_branch)
+        if merge_base == self._local_sha(base_branch):
+            skipped.append("rebase")
+            messages.info(
+                "«{}» is already on top of «{}», rebase skipped.".format(
+                    branch_name, base_branch
+                )
+            )
+
+        else:
+            self._rebase_branch(base_branch)
+
+        if self._local_sha(branch_name) == remote_sha:
+            skipped.append("push")
+            messages.info(
+                "«{}» is up to date on Github, push skipped.".format(
+                    branch_name
+                )
+            )
+
+        else:
+            self._push_branch(branch_name, force=True)
+
+        self.result.update(skipped=skipped)
+
+    def _delete_branches(self, local_branches, remote_branches):
+        if local_branches:
+            self.repo.git.branch("-D", *local_branches)
+
+        if remote_branches:
+            self.repo.git.push(
+                self.remote_name,
+                *[":{}".format(branch) for branch in remote_branches],
+            )
+
+    def _flow_refs(self, kinds, *options):
+        patterns = [
+            "refs/{}/{}".format(namespace, kind)
+            for namespace in ("heads", "remotes/{}".format(self.remote_name))
+            for kind in kinds
+        ]
+        output = self.repo.git.for_each_ref(
+            "--format=%(objectname) %(refname)", *(options + tuple(patterns))
+        )
+
+        refs = {}
+        for line in output.splitlines():
+            sha, ref = line.split(" ", 1)
+            refs[ref] = sha
+
+        return refs
+
+    def _finished_refs(self):
+        develop_ref = "{}/{}".format(self.remote_name, self.develop_branch)
+        main_ref = "{}/{}".format(self.remote_name, self.main_branch)
+
+        # Features are finished once merged into develop, releases and
+        # hotfixes once tagged with their version or merged into main.
+        refs = self._flow_refs(("feature",), "--merged", develop_ref)
+        refs.update(self._flow_refs(self.branch_kinds, "--merged", main_ref))
+
+        tags = {str(version) for version in self.versions}
+        for ref, sha in self._flow_refs(("release", "hotfix")).items():
+            if ref.rsplit("/", 1)[-1] in tags:
+                refs[ref] = sha
+
+        # A branch still pointing at the tip of a base has no commits of
+        # its own yet: it has been started, not finished.
+        base_shas = set(self.repo.git.rev_parse(develop_ref, main_ref).split())
+
+        return {ref for ref, sha in refs.items() if sha not in base_shas}
+
+    def _prunable_branches(self):
+        merged_refs = self._finished_refs()
+
+        local_prefix = "refs/heads/"
+        remote_prefix = "refs/remotes/{}/".format(self.remote_name)
+
+        local_branches = sorted(
+            ref.replace(local_prefix, "", 1)
+            for ref in merged_refs
+            if ref.startswith(local_prefix)
+        )
+        remote_branches = sorted(
+            ref.replace(remote_prefix, "", 1)
+            for ref in merged_refs
+            if ref.startswith(remote_prefix)
+        )
+
+        return local_branches, remote_branches
+
     def _tags(self):
         return [tag.name for tag in self.repo.tags]
 
+    def _versions(self, tags=None):
+        if tags is None:
+            tags = self._tags()
+
+        versions = []
+        for tag in tags:
+            try:
+                versions.append(models.Version.parse(tag))
+
+            except ValueError:
+                continue
+
+        return sorted(versions)
+
+    def _feature(self, issue_id):
+        issue_id = validators.validate_issue_id(issue_id)
+        return models.Feature(models.Issue(self.jira_project_key, issue_id))
+
     def _create_tag(self, version, ref=None):
         if ref:
             return self.repo.create_tag(version, ref=ref)
@@ -74,6 +245,12 @@ class Glow(object):
         self.repo.git.fetch(self.remote_name, "--tags")
         messages.success("↓ tags pulled.")
 
+    def _fetch_tag(self, tag_name):
+        self.repo.git.fetch(
+            self.remote_name, "refs/tags/{0}:refs/tags/{0}".format(tag_name)
+        )
+        messages.success("↓ tag «{}» fetched.".format(tag_name))
+
     def _push_tags(self):
         self.repo.git.push(self.remote_name, "--tags")
         messages.info("↑ tags pushed.")
@@ -83,6 +260,11 @@ class Glow(object):
             "{}...{}".format(source_branch, dest_branch), "--pretty=format:%s"
         )
 
+    def _fail(self, exit_code, message, level=messages.error):
+        level(message)
+        self.result.fail(exit_code, message)
+        return False
+
     def _create_config(self):
         self.jira_project_key = messages.question("Jira Project Key? ").upper()
         self.github_repository_name = messages.question(
@@ -90,8 +272,8 @@ class Glow(object):
         )
         self.github_token = messages.question("Github Token? ")
 
-    def _init_repo(self):
-        self.current_directory = os.getcwd()
+    def _init_repo(self, path=None):
+        self.current_directory = path or os.getcwd()
 
         try:
             self.repo = Repo(
@@ -101,133 +283,454 @@ class Glow(object):
             self.working_directory = self.repo.working_dir
             self.git_directory = self.repo.git_dir
 
-        except InvalidGitRepositoryError:
+        except (InvalidGitRepositoryError, NoSuchPathError):
             messages.critical("You are not in a git repository")
-            sys.exit(errno.ENOENT)
+            sys.exit(results.EXIT_NOT_A_REPOSITORY)
+
+    def _is_configured(self):
+        return all(
+            (
+                self.github_token,
+                self.github_repository_name,
+                self.jira_project_key,
+            )
+        )
+
+    def _write_config(self):
+        with self.repo.config_writer() as config_writer:
+            # fmt: off
+            if not config_writer.has_section("glow"):
+                config_writer.add_section("glow")
+
+            config_writer.set(
+                "glow",
+                "github-token",
+                self.github_token,
+            )
+            config_writer.set(
+                "glow",
+                "github-repository-name",
+                self.github_repository_name,
+            )
+            config_writer.set(
+                "glow",
+                "jira-project-key",
+                self.jira_project_key,
+            )
+            # fmt: on
 
     def _init_glow(self):
-        with self.repo.config_reader() as config_reader:
-            if config_reader.has_section("glow"):
-                # fmt: off
-                self.github_token = config_reader.get(
-                    "glow", "github-token"
-                )
-                self.github_repository_name = config_reader.get(
-                    "glow", "github-repository-name"
-                )
-                self.jira_project_key = config_reader.get(
-                    "glow", "jira-project-key"
-                )
-                # fmt: on
+        config = settings.load(self.repo.common_dir)
 
-            else:
-                create_a_glow_file = messages.question(
-                    "Create a glow config? [Y/n] "
-                )
+        self.github_token = config.get("github-token")
+        self.github_repository_name = config.get("github-repository-name")
+        self.jira_project_key = config.get("jira-project-key")
 
-                if create_a_glow_file.lower() != "y":
-                    messages.warning(
-                        "Command can't be used without configuration"
-                    )
-                    sys.exit(errno.EPERM)
-
-                else:
-                    self._create_config()
-
-                    with self.repo.config_writer() as config_writer:
-                        # fmt: off
-                        config_writer.add_section("glow")
-                        config_writer.set(
-                            "glow",
-                            "github-token",
-                            self.github_token,
-                        )
-                        config_writer.set(
-                            "glow",
-                            "github-repository-name",
-                            self.github_repository_name,
-                        )
-                        config_writer.set(
-                            "glow",
-                            "jira-project-key",
-                            self.jira_project_key,
-                        )
-                        # fmt: on
+        self.main_branch = config.get("main-branch", self.main_branch)
+        self.develop_branch = config.get("develop-branch", self.develop_branch)
+        self.remote_name = config.get("remote-name", self.remote_name)
+
+        if self._is_configured():
+            return
+
+        if not self.interactive:
+            messages.critical(
+                "Glow configuration is incomplete, set the [glow] section "
+                "or the GLOW_* environment variables"
+            )
+            sys.exit(results.EXIT_CONFIG)
+
+        create_a_glow_file = messages.question("Create a glow config? [Y/n] ")
+
+        if create_a_glow_file.lower() != "y":
+            messages.warning("Command can't be used without configuration")
+            sys.exit(results.EXIT_CONFIG)
+
+        self._create_config()
+        self._write_config()
 
     def _init_version(self):
         tags = self._tags()
+        self.versions = self._versions(tags)
 
-        if not tags:
-            self.version = semver.VersionInfo.parse(self.version)
-
-            messages.warning("No version found for this repository...")
-            first_commit = self.repo.git.rev_list("--max-parents=0", "HEAD")
-            messages.warning(
-                "Generate first version «{}» on first commit".format(
-                    self.version
-                )
+        if tags and not self.versions:
+            messages.critical(
+                "No semantic version found in tags ({}), tag the latest "
+                "version as MAJOR.MINOR.PATCH".format(", ".join(tags[:3]))
             )
+            sys.exit(results.EXIT_FAILURE)
 
-            self._create_tag(self.version, first_commit)
+        if not self.versions:
+            self.version = models.Version.parse(self.version)
+            self.versions = [self.version]
 
-            self._push_tags()
-            messages.success(
-                "Version {} pushed to remote repository".format(self.version)
+            messages.warning("No version found for this repository...")
+            self.first_commit = self.repo.git.rev_list(
+                "--max-parents=0", "HEAD"
             )
 
+            # A plan only reports the first version as one of its steps.
+            if not self.plan_only:
+                self._tag_first_version()
+
         else:
-            tags.sort(reverse=True)
-            latest = tags[0]
-            self.version = semver.VersionInfo.parse(latest)
-            messages.log(":label:  Latest version: {}".format(latest))
+            self.version = self.versions[-1]
+            messages.log(":label:  Latest version: {}".format(self.version.tag))
+
+    def _tag_first_version(self):
+        messages.warning(
+            "Generate first version «{}» on first commit".format(self.version)
+        )
 
-    def __init__(self):
+        self._create_tag(str(self.version), self.first_commit)
+
+        self._push_tags()
+        messages.success(
+            "Version {} pushed to remote repository".format(self.version)
+        )
+
+    def __init__(
+        self,
+        path=None,
+        assume_yes=False,
+        interactive=True,
+        plan_only=False,
+        result=None,
+    ):
         """Initialize Github Flow CLI"""
 
-        colorama.init(autoreset=True)
+        self.interactive = interactive
+        self.assume_yes = assume_yes
+        self.plan_only = plan_only
+        self.result = result or results.Result()
 
-        self._init_repo()
+        self._init_repo(path)
         self._init_glow()
         self._init_version()
 
+    def _check_local_branch(self, branch):
+        if self._branch_exists(branch.name):
+            return True
+
+        return self._fail(
+            results.EXIT_BRANCH_STATE,
+            "«{}» doesn't exists locally.".format(branch.name),
+        )
+
+    def _check_remote_branch(self, branch):
+        if integrations.branch_exists(
+            self.github_token, self.github_repository_name, branch.name
+        ):
+            return True
+
+        return self._fail(
+            results.EXIT_BRANCH_STATE,
+            "«{}» doesn't exists remotely.".format(branch.name),
+        )
+
+    def _merge_remotely(self, branch):
+        status_code = integrations.merge_branch(
+            self.github_token,
+            self.github_repository_name,
+            self.develop_branch,
+            branch.name,
+            "Merge branch '{}' into {}".format(
+                branch.name, self.develop_branch
+            ),
+        )
+
+        if status_code == 409:
+            return self._fail(
+                results.EXIT_BRANCH_STATE,
+                "«{}» can not be merged into «{}» on Github.".format(
+                    branch.name, self.develop_branch
+                ),
+                messages.critical,
+            )
+
+        elif status_code not in (201, 204):
+            return self._fail(
+                results.EXIT_REMOTE,
+                "{} can not be merged on Github ({}:).".format(
+                    branch.name, status_code
+                ),
+                messages.critical,
+            )
+
+        messages.success(
+            "«{}» merged into «{}» on Github.".format(
+                branch.name, self.develop_branch
+            )
+        )
+        return True
+
+    def _tag_remotely(self, branch):
+        main_sha = integrations.branch_exists(
+            self.github_token, self.github_repository_name, self.main_branch
+        )
+        status_code = integrations.create_tag(
+            self.github_token,
+            self.github_repository_name,
+            branch.title,
+            main_sha,
+        )
+
+        if status_code != 201:
+            return self._fail(
+                results.EXIT_REMOTE,
+                "{} can not be tagged on Github ({}:).".format(
+                    branch.title, status_code
+                ),
+                messages.critical,
+            )
+
+        self.result.update(sha=main_sha)
+        messages.success("Version {} tagged on Github.".format(branch.title))
+        return True
+
+    def _delete_remotely(self, branch):
+        status_code = integrations.delete_branch(
+            self.github_token, self.github_repository_name, branch
+        )
+
+        if status_code != 204:
+            return self._fail(
+                results.EXIT_REMOTE,
+                "{} can not be deleted on Github ({}:).".format(
+                    branch.name, status_code
+                ),
+                messages.critical,
+            )
+
+        return True
+
+    def _plan_first_version(self, plan):
+        if self.plan_only and self.first_commit:
+            plan.add(
+                "tag",
+                "Tag the first commit with «{}» and push it".format(
+                    self.version
+                ),
+                self._tag_first_version,
+                refs=["refs/tags/{}".format(self.version)],
+                subprocesses=2,
+                round_trips=1,
+            )
+
+        return plan
+
+    def _plan_finish_remotely(self, branch):
+        remote_branch = "{}/{}".format(self.remote_name, branch.name)
+        remote_develop = "{}/{}".format(self.remote_name, self.develop_branch)
+        tag_ref = "refs/tags/{}".format(branch.title)
+
+        plan = plans.Plan(
+            "finish {} {} --remote-only".format(branch.kind, branch.title),
+            resolve=self._local_sha,
+        )
+        self._plan_first_version(plan)
+        plan.add(
+            "api",
+            "Check «{}» exists on Github".format(branch.name),
+            functools.partial(self._check_remote_branch, branch),
+            refs=[remote_branch],
+            round_trips=1,
+            read_only=True,
+        )
+        plan.add(
+            "api",
+            "Merge «{}» into «{}» on Github".format(
+                branch.name, self.develop_branch
+            ),
+            functools.partial(self._merge_remotely, branch),
+            refs=[remote_develop],
+            round_trips=1,
+        )
+        plan.add(
+            "api",
+            "Tag «{}» with «{}» on Github".format(
+                self.main_branch, branch.title
+            ),
+            functools.partial(self._tag_remotely, branch),
+            refs=[tag_ref],
+            round_trips=2,
+        )
+        plan.add(
+            "api",
+            "Delete «{}» on Github".format(branch.name),
+            functools.partial(self._delete_remotely, branch),
+            refs=[remote_branch],
+            round_trips=1,
+        )
+        plan.add(
+            "fetch",
+            "Fetch tag «{}»".format(branch.title),
+            functools.partial(self._fetch_tag, branch.title),
+            refs=[tag_ref],
+            subprocesses=1,
+            round_trips=1,
+        )
+        return plan
+
+    def _plan_finish(self, branch):
+        remote_branch = "{}/{}".format(self.remote_name, branch.name)
+        tag_ref = "refs/tags/{}".format(branch.title)
+
+        plan = plans.Plan(
+            "finish {} {}".format(branch.kind, branch.title),
+            resolve=self._local_sha,
+        )
+        self._plan_first_version(plan)
+        plan.add(
+            "check",
+            "Check «{}» exists locally".format(branch.name),
+            functools.partial(self._check_local_branch, branch),
+            refs=[branch.name],
+            subprocesses=1,
+            read_only=True,
+        )
+        plan.add(
+            "api",
+            "Check «{}» exists on Github".format(branch.name),
+            functools.partial(self._check_remote_branch, branch),
+            refs=[remote_branch],
+            round_trips=1,
+            read_only=True,
+        )
+        plan.add(
+            "pull",
+            "Checkout and pull «{}»".format(self.main_branch),
+            functools.partial(self._pull_branch, self.main_branch),
+            refs=[self.main_branch],
+            subprocesses=2,
+            round_trips=1,
+        )
+        plan.add(
+            "tag",
+            "Tag «{}» with «{}»".format(self.main_branch, branch.title),
+            functools.partial(self._create_tag, branch.title),
+            refs=[tag_ref],
+            subprocesses=1,
+        )
+        plan.add(
+            "pull",
+            "Checkout and pull «{}»".format(self.develop_branch),
+            functools.partial(self._pull_branch, self.develop_branch),
+            refs=[self.develop_branch],
+            subprocesses=2,
+            round_trips=1,
+        )
+        plan.add(
+            "merge",
+            "Merge «{}» into «{}»".format(branch.name, self.develop_branch),
+            functools.partial(self.repo.git.merge, "--no-ff", branch.name),
+            refs=[self.develop_branch],
+            subprocesses=1,
+        )
+        plan.add(
+            "delete",
+            "Delete «{}» locally and on «{}»".format(
+                branch.name, self.remote_name
+            ),
+            functools.partial(
+                self._delete_branches, [branch.name], [branch.name]
+            ),
+            refs=[branch.name, remote_branch],
+            subprocesses=2,
+            round_trips=1,
+        )
+        plan.add(
+            "push",
+            "Push «{}»".format(self.develop_branch),
+            functools.partial(
+                self.repo.git.push, self.remote_name, self.develop_branch
+            ),
+            refs=[self.develop_branch],
+            subprocesses=1,
+            round_trips=1,
+        )
+        plan.add(
+            "push",
+            "Push tags",
+            self._push_tags,
+            refs=[tag_ref],
+            subprocesses=1,
+            round_trips=1,
+        )
+        return plan
+
+    def _finish(self, branch):
+        """Finish a release or hotfix branch, or only report its plan"""
+
+        if self.remote_only:
+            plan = self._plan_finish_remotely(branch)
+
+        else:
+            plan = self._plan_finish(branch)
+
+        if self.plan_only:
+            # Checks only read the current refs, they are resolved now.
+            succeeded = plan.check()
+            plan.report()
+            self.result.update(plan=plan.as_dict())
+            return succeeded
+
+        if not plan.execute():
+            return False
+
+        self.result.update(branch=branch.name, tag=branch.title)
+        messages.success(":fireworks:  «{}» finished.".format(branch.name))
+
+        if self.remote_only:
+            messages.info(
+                "Run «git glow prune» to clean up your local repository."
+            )
+
+        return True
+
     """ Feature methods """
 
     def start_feature(self, issue_id):
-        issue_id = validators.validate_issue_id(issue_id)
-        feature_name = "{}-{}".format(self.jira_project_key, issue_id)
-        branch_name = "feature/{}".format(feature_name)
+        feature = self._feature(issue_id)
+        branch_name = feature.name
 
         if self._branch_exists(branch_name):
-            messages.error("«{}» already exists locally.".format(branch_name))
-            return False
+            return self._fail(
+                results.EXIT_BRANCH_STATE,
+                "«{}» already exists locally.".format(branch_name),
+            )
 
         if integrations.branch_exists(
             self.github_token, self.github_repository_name, branch_name
         ):
-            messages.warning(
-                "«{}» already exists remotely.".format(branch_name)
-            )
             self._pull_branch(branch_name, create=True)
-            return False
+            return self._fail(
+                results.EXIT_BRANCH_STATE,
+                "«{}» already exists remotely.".format(branch_name),
+                messages.warning,
+            )
 
         question = "Start feature name: «{}» [y/n] ".format(branch_name)
-        helpers.ask(question)
+        helpers.ask(
+            question,
+            assume_yes=self.assume_yes,
+            interactive=self.interactive,
+        )
 
         commit_sha = integrations.branch_exists(
             self.github_token, self.github_repository_name, self.develop_branch
         )
-        commit_ref = "refs/heads/{}".format(branch_name)
+        self.result.update(branch=branch_name, sha=commit_sha)
 
         status_code = integrations.create_branch(
             self.github_token,
             self.github_repository_name,
-            commit_ref,
-            commit_sha,
+            feature.with_sha(commit_sha),
         )
 
         if status_code == 201:
             messages.success("«{}» created on Github".format(branch_name))
-            self._pull_branch(branch_name, create=True)
+            self._start_branch(branch_name, self.develop_branch, commit_sha)
             messages.success("Switch to «{}».".format(branch_name))
             return True
 
@@ -238,35 +741,39 @@ class Glow(object):
             return True
 
         else:
-            messages.critical(
+            return self._fail(
+                results.EXIT_REMOTE,
                 "{} can not be created on Github ({}:).".format(
                     branch_name,
                     status_code,
-                )
+                ),
+                messages.critical,
             )
-            return False
 
     def review_feature(self, issue_id):
-        issue_id = validators.validate_issue_id(issue_id)
-        feature_name = "{}-{}".format(self.jira_project_key, issue_id)
-        branch_name = "feature/{}".format(feature_name)
+        feature = self._feature(issue_id)
+        feature_name = feature.title
+        branch_name = feature.name
 
         if not self._branch_exists(branch_name):
-            messages.error("«{}» doesn't exists locally.".format(branch_name))
-            return False
+            return self._fail(
+                results.EXIT_BRANCH_STATE,
+                "«{}» doesn't exists locally.".format(branch_name),
+            )
 
-        if not integrations.branch_exists(
+        remote_sha = integrations.branch_exists(
             self.github_token, self.github_repository_name, branch_name
-        ):
-            messages.error("«{}» doesn't exists remotely.".format(branch_name))
-            return False
+        )
+        if not remote_sha:
+            return self._fail(
+                results.EXIT_BRANCH_STATE,
+                "«{}» doesn't exists remotely.".format(branch_name),
+            )
 
         self._change_branch(self.develop_branch)
         self._pull_branch(self.develop_branch)
 
-        self._change_branch(branch_name)
-        self._rebase_branch(self.develop_branch)
-        self._push_branch(branch_name, force=True)
+        self._sync_branch(branch_name, self.develop_branch, remote_sha)
 
         changes = self._get_changes(branch_name, self.develop_branch)
 
@@ -279,92 +786,152 @@ class Glow(object):
             changes,
         )
 
+        self.result.update(branch=branch_name, sha=self._local_sha(branch_name))
+
         if status_code == 201:
+            self.result.update(pull_request_url=response)
             messages.success("New PR created: {}".format(response))
             return True
 
+        elif status_code == 200:
+            self.result.update(pull_request_url=response)
+            messages.success("PR updated: {}".format(response))
+            return True
+
         else:
             for error in response:
-                messages.critical(error)
+                self._fail(results.EXIT_REMOTE, error, messages.critical)
             return False
 
     def finish_feature(self, issue_id):
-        issue_id = validators.validate_issue_id(issue_id)
-        feature_name = "{}-{}".format(self.jira_project_key, issue_id)
-        branch_name = "feature/{}".format(feature_name)
+        feature = self._feature(issue_id)
+        branch_name = feature.name
 
         if not self._branch_exists(branch_name):
-            messages.error("«{}» doesn't exists locally.".format(branch_name))
-            return False
+            return self._fail(
+                results.EXIT_BRANCH_STATE,
+                "«{}» doesn't exists locally.".format(branch_name),
+            )
 
         if not integrations.branch_exists(
             self.github_token, self.github_repository_name, branch_name
         ):
-            messages.error("«{}» doesn't exists remotely.".format(branch_name))
-            return False
+            return self._fail(
+                results.EXIT_BRANCH_STATE,
+                "«{}» doesn't exists remotely.".format(branch_name),
+            )
 
         self._change_branch(self.develop_branch)
         self._pull_branch(self.develop_branch)
 
-        self.repo.git.branch("-D", branch_name)
-        self.repo.git.push(self.remote_name, ":{}".format(branch_name))
-        self.repo.git.remote("prune", self.remote_name)
+        self._delete_branches([branch_name], [branch_name])
 
+        self.result.update(branch=branch_name)
         messages.success(":fireworks:  «{}» finished.".format(branch_name))
 
     def cancel_feature(self, issue_id):
         messages.warning("Not implemented yet")
 
+    """ Branches methods """
+
+    def prune(self):
+        self.repo.git.fetch(self.remote_name, "--prune")
+
+        local_branches, remote_branches = self._prunable_branches()
+
+        current_branch = self.repo.git.rev_parse("--abbrev-ref", "HEAD")
+        if current_branch in local_branches:
+            messages.warning(
+                "«{}» is checked out, it will not be pruned.".format(
+                    current_branch
+                )
+            )
+            local_branches.remove(current_branch)
+
+        if not local_branches and not remote_branches:
+            messages.success("Nothing to prune.")
+            return True
+
+        for branch_name in local_branches:
+            messages.log("  «{}»".format(branch_name))
+
+        for branch_name in remote_branches:
+            messages.log("  «{}/{}»".format(self.remote_name, branch_name))
+
+        question = "Prune {} local and {} remote branches [y/n] ".format(
+            len(local_branches), len(remote_branches)
+        )
+        helpers.ask(
+            question,
+            assume_yes=self.assume_yes,
+            interactive=self.interactive,
+        )
+
+        self._delete_branches(local_branches, remote_branches)
+
+        self.result.update(
+            pruned_local=local_branches, pruned_remote=remote_branches
+        )
+        messages.success(":broom:  Merged branches pruned.")
+        return True
+
     """ Release methods """
 
     def start_release(self):
-        release_name = self.version.bump_minor()
-        branch_name = "release/{}".format(release_name)
+        release = models.Release(self.version.bump_minor())
+        release_name = release.title
+        branch_name = release.name
 
-        hotfix_name = self.version.bump_patch()
-        hotfix_branch_name = "hotfix/{}".format(hotfix_name)
+        hotfix_branch_name = models.Hotfix(self.version.bump_patch()).name
 
         if self._branch_exists(branch_name):
-            messages.error("«{}» already exists locally.".format(branch_name))
-            return False
+            return self._fail(
+                results.EXIT_BRANCH_STATE,
+                "«{}» already exists locally.".format(branch_name),
+            )
 
         if integrations.branch_exists(
             self.github_token, self.github_repository_name, branch_name
         ):
-            messages.warning(
-                "«{}» already exists remotely.".format(branch_name)
-            )
             self._pull_branch(branch_name, create=True)
-            return False
+            return self._fail(
+                results.EXIT_BRANCH_STATE,
+                "«{}» already exists remotely.".format(branch_name),
+                messages.warning,
+            )
 
         if integrations.branch_exists(
             self.github_token, self.github_repository_name, hotfix_branch_name
         ):
-            messages.critical(
-                "An hotfix «{}» is running...".format(hotfix_branch_name)
+            return self._fail(
+                results.EXIT_BRANCH_STATE,
+                "An hotfix «{}» is running...".format(hotfix_branch_name),
+                messages.critical,
             )
-            return False
 
         question = "Start release «{}» [y/n] ".format(release_name)
-        helpers.ask(question)
+        helpers.ask(
+            question,
+            assume_yes=self.assume_yes,
+            interactive=self.interactive,
+        )
 
         self._pull_branch(self.develop_branch)
 
         commit_sha = integrations.branch_exists(
             self.github_token, self.github_repository_name, self.develop_branch
         )
-        commit_ref = "refs/heads/{}".format(branch_name)
+        self.result.update(branch=branch_name, sha=commit_sha)
 
         status_code = integrations.create_branch(
             self.github_token,
             self.github_repository_name,
-            commit_ref,
-            commit_sha,
+            release.with_sha(commit_sha),
         )
 
         if status_code == 201:
             messages.success("«{}» created on Github".format(branch_name))
-            self._pull_branch(branch_name, create=True)
+            self._start_branch(branch_name, self.develop_branch, commit_sha)
             messages.success("Switch to «{}».".format(branch_name))
             return True
 
@@ -375,34 +942,39 @@ class Glow(object):
             return True
 
         else:
-            messages.critical(
+            return self._fail(
+                results.EXIT_REMOTE,
                 "{} can not be created on Github ({}:).".format(
                     branch_name,
                     status_code,
-                )
+                ),
+                messages.critical,
             )
-            return False
 
     def review_release(self):
-        release_name = self.version.bump_minor()
-        branch_name = "release/{}".format(release_name)
+        release = models.Release(self.version.bump_minor())
+        release_name = release.title
+        branch_name = release.name
 
         if not self._branch_exists(branch_name):
-            messages.error("«{}» doesn't exists locally.".format(branch_name))
-            return False
+            return self._fail(
+                results.EXIT_BRANCH_STATE,
+                "«{}» doesn't exists locally.".format(branch_name),
+            )
 
-        if not integrations.branch_exists(
+        remote_sha = integrations.branch_exists(
             self.github_token, self.github_repository_name, branch_name
-        ):
-            messages.error("«{}» doesn't exists remotely.".format(branch_name))
-            return False
+        )
+        if not remote_sha:
+            return self._fail(
+                results.EXIT_BRANCH_STATE,
+                "«{}» doesn't exists remotely.".format(branch_name),
+            )
 
         self._change_branch(self.main_branch)
         self._pull_branch(self.main_branch)
 
-        self._change_branch(branch_name)
-        self._rebase_branch(self.develop_branch)
-        self._push_branch(branch_name, force=True)
+        self._sync_branch(branch_name, self.develop_branch, remote_sha)
 
         changes = self._get_changes(branch_name, self.main_branch)
 
@@ -411,50 +983,29 @@ class Glow(object):
             self.github_repository_name,
             branch_name,
             self.main_branch,
-            str(release_name),
+            release_name,
             changes,
         )
 
+        self.result.update(branch=branch_name, sha=self._local_sha(branch_name))
+
         if status_code == 201:
+            self.result.update(pull_request_url=response)
             messages.success("New PR created: {}".format(response))
             return True
 
+        elif status_code == 200:
+            self.result.update(pull_request_url=response)
+            messages.success("PR updated: {}".format(response))
+            return True
+
         else:
             for error in response:
-                messages.error(error)
+                self._fail(results.EXIT_REMOTE, error)
             return False
 
     def finish_release(self):
-        release_name = self.version.bump_minor()
-        branch_name = "release/{}".format(release_name)
-
-        if not self._branch_exists(branch_name):
-            messages.error("«{}» doesn't exists locally.".format(branch_name))
-            return False
-
-        if not integrations.branch_exists(
-            self.github_token, self.github_repository_name, branch_name
-        ):
-            messages.error("«{}» doesn't exists remotely.".format(branch_name))
-            return False
-
-        self._change_branch(self.main_branch)
-        self._pull_branch(self.main_branch)
-
-        self._create_tag(str(release_name))
-
-        self._change_branch(self.develop_branch)
-        self._pull_branch(self.develop_branch)
-
-        self.repo.git.merge("--no-ff", branch_name)
-        self.repo.git.branch("-D", branch_name)
-        self.repo.git.push(self.remote_name, ":{}".format(branch_name))
-        self.repo.git.push(self.remote_name, self.develop_branch)
-        self.repo.git.remote("prune", self.remote_name)
-
-        self._push_tags()
-
-        messages.success(":fireworks:  «{}» finished.".format(branch_name))
+        return self._finish(models.Release(self.version.bump_minor()))
 
     def cancel_release(self, is_master=False):
         messages.warning("Not implemented yet")
@@ -462,42 +1013,49 @@ class Glow(object):
     """ Hotfix methods """
 
     def start_hotfix(self):
-        hotfix_name = self.version.bump_patch()
-        branch_name = "hotfix/{}".format(hotfix_name)
+        hotfix = models.Hotfix(self.version.bump_patch())
+        hotfix_name = hotfix.title
+        branch_name = hotfix.name
 
         if self._branch_exists(branch_name):
-            messages.error("«{}» already exists locally.".format(branch_name))
-            return False
+            return self._fail(
+                results.EXIT_BRANCH_STATE,
+                "«{}» already exists locally.".format(branch_name),
+            )
 
         if integrations.branch_exists(
             self.github_token, self.github_repository_name, branch_name
         ):
-            messages.warning(
-                "«{}» already exists remotely.".format(branch_name)
-            )
             self._pull_branch(branch_name, create=True)
-            return False
+            return self._fail(
+                results.EXIT_BRANCH_STATE,
+                "«{}» already exists remotely.".format(branch_name),
+                messages.warning,
+            )
 
         question = "Start hotfix «{}» [y/n] ".format(hotfix_name)
-        helpers.ask(question)
+        helpers.ask(
+            question,
+            assume_yes=self.assume_yes,
+            interactive=self.interactive,
+        )
 
         self._pull_branch(self.main_branch)
 
         commit_sha = integrations.branch_exists(
             self.github_token, self.github_repository_name, self.main_branch
         )
-        commit_ref = "refs/heads/{}".format(branch_name)
+        self.result.update(branch=branch_name, sha=commit_sha)
 
         status_code = integrations.create_branch(
             self.github_token,
             self.github_repository_name,
-            commit_ref,
-            commit_sha,
+            hotfix.with_sha(commit_sha),
         )
 
         if status_code == 201:
             messages.success("«{}» created on Github".format(branch_name))
-            self._pull_branch(branch_name, create=True)
+            self._start_branch(branch_name, self.main_branch, commit_sha)
             messages.success("Switch to «{}».".format(branch_name))
             return True
 
@@ -508,34 +1066,39 @@ class Glow(object):
             return True
 
         else:
-            messages.critical(
+            return self._fail(
+                results.EXIT_REMOTE,
                 "{} can not be created on Github ({}:).".format(
                     branch_name,
                     status_code,
-                )
+                ),
+                messages.critical,
             )
-            return False
 
     def review_hotfix(self):
-        hotfix_name = self.version.bump_patch()
-        branch_name = "hotfix/{}".format(hotfix_name)
+        hotfix = models.Hotfix(self.version.bump_patch())
+        hotfix_name = hotfix.title
+        branch_name = hotfix.name
 
         if not self._branch_exists(branch_name):
-            messages.error("«{}» doesn't exists locally.".format(branch_name))
-            return False
+            return self._fail(
+                results.EXIT_BRANCH_STATE,
+                "«{}» doesn't exists locally.".format(branch_name),
+            )
 
-        if not integrations.branch_exists(
+        remote_sha = integrations.branch_exists(
             self.github_token, self.github_repository_name, branch_name
-        ):
-            messages.error("«{}» doesn't exists remotely.".format(branch_name))
-            return False
+        )
+        if not remote_sha:
+            return self._fail(
+                results.EXIT_BRANCH_STATE,
+                "«{}» doesn't exists remotely.".format(branch_name),
+            )
 
         self._change_branch(self.main_branch)
         self._pull_branch(self.main_branch)
 
-        self._change_branch(branch_name)
-        self._rebase_branch(self.main_branch)
-        self._push_branch(branch_name, force=True)
+        self._sync_branch(branch_name, self.main_branch, remote_sha)
 
         changes = self._get_changes(branch_name, self.main_branch)
 
@@ -544,66 +1107,109 @@ class Glow(object):
             self.github_repository_name,
             branch_name,
             self.main_branch,
-            str(hotfix_name),
+            hotfix_name,
             changes,
         )
 
+        self.result.update(branch=branch_name, sha=self._local_sha(branch_name))
+
         if status_code == 201:
+            self.result.update(pull_request_url=response)
             messages.success("New PR created: {}".format(response))
             return True
 
+        elif status_code == 200:
+            self.result.update(pull_request_url=response)
+            messages.success("PR updated: {}".format(response))
+            return True
+
         else:
             for error in response:
-                messages.error(error)
+                self._fail(results.EXIT_REMOTE, error)
             return False
 
     def finish_hotfix(self):
-        hotfix_name = self.version.bump_patch()
-        branch_name = "hotfix/{}".format(hotfix_name)
+        return self._finish(models.Hotfix(self.version.bump_patch()))
 
-        if not self._branch_exists(branch_name):
-            messages.error("«{}» doesn't exists locally.".format(branch_name))
+    def cancel_hotfix(self):
+        messages.warning("Not implemented yet")
+
+    """Main"""
+
+    def main(self, args=None):
+        if args is None:
+            args = helpers.parse_args()
+
+        method_name = helpers.get_method_name(args)
+        methods_names = helpers.get_method_names(self)
+
+        validators.validate_method_name(method_name, methods_names)
+        validators.validate_options(method_name, args)
+
+        _func = getattr(self, method_name)
+        validators.validate_arguments(_func, args.key)
+
+        self.remote_only = args.remote_only
+        self.plan_only = args.plan
+
+        try:
+            succeeded = _func(*args.key)
+
+        except GitCommandError as exc:
+            messages.critical(str(exc))
+            self.result.fail(results.EXIT_GIT, str(exc))
             return False
 
-        if not integrations.branch_exists(
-            self.github_token, self.github_repository_name, branch_name
-        ):
-            messages.error("«{}» doesn't exists remotely.".format(branch_name))
+        except RequestException as exc:
+            messages.critical(str(exc))
+            self.result.fail(results.EXIT_REMOTE, str(exc))
             return False
 
-        self._change_branch(self.main_branch)
-        self._pull_branch(self.main_branch)
+        if succeeded is False:
+            self.result.fail(results.EXIT_FAILURE)
 
-        self._create_tag(str(hotfix_name))
+        return succeeded is not False
 
-        self._change_branch(self.develop_branch)
-        self._pull_branch(self.develop_branch)
 
-        self.repo.git.merge("--no-ff", branch_name)
-        self.repo.git.branch("-D", branch_name)
-        self.repo.git.push(self.remote_name, ":{}".format(branch_name))
-        self.repo.git.push(self.remote_name, self.develop_branch)
-        self.repo.git.remote("prune", self.remote_name)
+def run(args, path=None):
+    """Run a glow command and return its result, without exiting"""
 
-        self._push_tags()
+    result = results.Result(helpers.get_command(args))
 
-        messages.success(":fireworks:  «{}» finished.".format(branch_name))
+    try:
+        validators.validate_options(helpers.get_method_name(args), args)
 
-    def cancel_hotfix(self):
-        messages.warning("Not implemented yet")
+        with result.timer("init"):
+            glow = Glow(
+                path=path,
+                assume_yes=args.yes,
+                interactive=not args.non_interactive,
+                plan_only=args.plan,
+                result=result,
+            )
 
-    """Main"""
+        with result.timer("command"):
+            glow.main(args)
 
-    def main(self):
-        args = helpers.parse_args()
+    except SystemExit as exc:
+        result.fail(
+            exc.code if isinstance(exc.code, int) else results.EXIT_FAILURE
+        )
 
-        method_name = "{}_{}".format(args.action, args.entity)
-        methods_names = helpers.get_method_names(self)
+    except EOFError:
+        messages.critical("No answer available, use --yes or --non-interactive")
+        result.fail(results.EXIT_ABORTED)
 
-        validators.validate_method_name(method_name, methods_names)
+    except GitCommandError as exc:
+        messages.critical(str(exc))
+        result.fail(results.EXIT_GIT, str(exc))
 
-        _func = getattr(self, method_name)
-        _func(*args.key)
+    except RequestException as exc:
+        messages.critical(str(exc))
+        result.fail(results.EXIT_REMOTE, str(exc))
+
+    result.finish()
+    return result
 
 
 if __name__ == "__main__":
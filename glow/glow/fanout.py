@@ -0,0 +1,112 @@
+import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from . import helpers, integrations, messages, results, run
+
+
+def read_manifest(manifest_path):
+    """Return the repository paths listed in a manifest file
+
+    One path per line, blank lines and lines starting with # are ignored,
+    relative paths are resolved from the manifest directory.
+    """
+
+    root = os.path.dirname(os.path.abspath(manifest_path))
+
+    with open(manifest_path) as manifest:
+        lines = [line.strip() for line in manifest]
+
+    return [
+        os.path.normpath(os.path.join(root, os.path.expanduser(line)))
+        for line in lines
+        if line and not line.startswith("#")
+    ]
+
+
+def _run_repository(args, path):
+    messages.prefix(os.path.basename(path))
+
+    try:
+        return run(args, path=path)
+
+    except Exception as exc:
+        # One broken repository must not lose the results of the others.
+        messages.critical(str(exc))
+        result = results.Result(helpers.get_command(args))
+        result.fail(results.EXIT_FAILURE, str(exc))
+        result.finish()
+        return result
+
+    finally:
+        messages.prefix(None)
+
+
+def run_manifest(args):
+    """Run a glow command across every repository of a manifest"""
+
+    result = results.Result(
+        "{} --manifest {}".format(helpers.get_command(args), args.manifest)
+    )
+
+    if args.jobs < 1:
+        message = "--jobs must be at least 1"
+        messages.critical(message)
+        result.fail(results.EXIT_USAGE, message)
+        result.finish()
+        return result
+
+    try:
+        paths = read_manifest(args.manifest)
+
+    except OSError as exc:
+        messages.critical("Unable to read manifest: {}".format(exc))
+        result.fail(results.EXIT_USAGE, str(exc))
+        result.finish()
+        return result
+
+    try:
+        helpers.ask(
+            "Run «{}» on {} repositories [y/n] ".format(
+                helpers.get_command(args), len(paths)
+            ),
+            assume_yes=args.yes,
+            interactive=not args.non_interactive,
+        )
+
+    except SystemExit as exc:
+        result.fail(exc.code)
+        result.finish()
+        return result
+
+    repository_args = argparse.Namespace(**vars(args))
+    repository_args.yes = True
+    repository_args.non_interactive = True
+
+    integrations.configure(pool_size=args.jobs, rate_limit=args.rate_limit)
+
+    with result.timer("command"):
+        with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+            repository_results = list(
+                executor.map(
+                    lambda path: _run_repository(repository_args, path),
+                    paths,
+                )
+            )
+
+    repositories = []
+    for path, repository_result in zip(paths, repository_results):
+        repositories.append(dict(repository_result.as_dict(), path=path))
+
+        if repository_result.succeeded:
+            messages.success("✔ {}".format(path))
+
+        else:
+            messages.error(
+                "✘ {} ({})".format(path, repository_result.exit_code)
+            )
+            result.fail(repository_result.exit_code)
+
+    result.update(repositories=repositories)
+    result.finish()
+    return result
@@ -1,22 +1,77 @@
 import argparse
 import sys
 
-from . import messages
+from . import messages, results
 
 
-def parse_args():
+def parse_args(args=None):
     parser = argparse.ArgumentParser(description="Glow your workflow")
     parser.add_argument("action")
-    parser.add_argument("entity")
+    parser.add_argument("entity", nargs="?", default=None)
     parser.add_argument("key", nargs="*", default=None)
-    return parser.parse_args()
+    parser.add_argument(
+        "-y",
+        "--yes",
+        action="store_true",
+        help="answer yes to every confirmation",
+    )
+    parser.add_argument(
+        "--non-interactive",
+        action="store_true",
+        help="never prompt, read missing configuration from environment",
+    )
+    parser.add_argument(
+        "--remote-only",
+        action="store_true",
+        help="finish releases and hotfixes with Github API calls only",
+    )
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="print the operations a finish would perform, without them",
+    )
+    parser.add_argument(
+        "--manifest",
+        help="file listing the repositories to run the command on",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=4,
+        help="number of repositories processed in parallel",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=int,
+        default=None,
+        help="maximum number of Github API calls",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="print a JSON result on stdout, messages go to stderr",
+    )
+    return parser.parse_args(args)
+
+
+def get_method_name(args):
+    if args.entity is None:
+        return args.action
+
+    return "{}_{}".format(args.action, args.entity)
+
+
+def get_command(args):
+    return " ".join(get_method_name(args).split("_"))
 
 
 def get_method_names(klass):
     return [
         func
         for func in dir(klass)
-        if callable(getattr(klass, func)) and not func.startswith("_")
+        if callable(getattr(klass, func))
+        if not func.startswith("_") and func != "main"
     ]
 
 
@@ -26,10 +81,30 @@ def ask(
         "y",
     ],
     exit_tty=True,
+    assume_yes=False,
+    interactive=True,
 ):
+    if assume_yes:
+        messages.log("{}{}".format(question, options[0]))
+        return True
+
+    if not interactive:
+        messages.warning(
+            "«{}» needs a confirmation, use --yes.".format(question.strip())
+        )
+
+        if exit_tty:
+            sys.exit(results.EXIT_ABORTED)
+
+        return False
+
     answer = messages.question(question)
     if answer.lower() not in options:
         messages.warning("Quitting...")
 
         if exit_tty:
-            sys.exit(1)
+            sys.exit(results.EXIT_ABORTED)
+
+        return False
+
+    return True
@@ -1,28 +1,102 @@
 import json
+import threading
 
-from requests import Session
+from requests import RequestException, Session
+from requests.adapters import HTTPAdapter
 
 from . import messages
 
 
 GITHUB_API_URL = "https://api.github.com"
 
+_session = None
+_session_lock = threading.Lock()
+_pool_size = 10
 
-def branch_exists(github_token, repository_name, branch_name):
-    session = Session()
 
+class RateLimitExceeded(RequestException):
+    """Raised when the Github rate-limit budget is exhausted"""
+
+
+class RateLimitBudget(object):
+    """Thread-safe budget of Github API calls shared by every flow"""
+
+    def __init__(self, limit=None):
+        self.remaining = limit
+        self._lock = threading.Lock()
+
+    def consume(self):
+        with self._lock:
+            if self.remaining is None:
+                return
+
+            if self.remaining <= 0:
+                raise RateLimitExceeded("Github rate-limit budget exhausted")
+
+            self.remaining -= 1
+
+    def update(self, response):
+        remaining = response.headers.get("X-RateLimit-Remaining")
+
+        if remaining is None:
+            return
+
+        with self._lock:
+            if self.remaining is None or int(remaining) < self.remaining:
+                self.remaining = int(remaining)
+
+
+budget = RateLimitBudget()
+
+
+def configure(pool_size=None, rate_limit=None):
+    global _pool_size, _session, budget
+
+    with _session_lock:
+        if pool_size:
+            _pool_size = pool_size
+            _session = None
+
+    budget = RateLimitBudget(rate_limit)
+
+
+def get_session():
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            _session = Session()
+            _session.mount(
+                "https://",
+                HTTPAdapter(pool_connections=1, pool_maxsize=_pool_size),
+            )
+
+        return _session
+
+
+def _request(method, github_token, path, payload=None, **kwargs):
     headers = {
         "Authorization": "token {}".format(github_token),
         "Content-Type": "application/json",
     }
 
-    response = session.get(
-        "{}/repos/{}/branches/{}".format(
-            GITHUB_API_URL,
-            repository_name,
-            branch_name,
-        ),
-        headers=headers,
+    if payload is not None:
+        kwargs["data"] = json.dumps(payload)
+
+    budget.consume()
+    response = get_session().request(
+        method, "{}{}".format(GITHUB_API_URL, path), headers=headers, **kwargs
+    )
+    budget.update(response)
+
+    return response
+
+
+def branch_exists(github_token, repository_name, branch_name):
+    response = _request(
+        "GET",
+        github_token,
+        "/repos/{}/branches/{}".format(repository_name, branch_name),
     )
 
     if response.status_code != 200:
@@ -41,36 +115,129 @@ def branch_exists(github_token, repository_name, branch_name):
     return commit_ref
 
 
-def create_branch(github_token, repository_name, commit_ref, commit_sha):
-    session = Session()
-    headers = {
-        "Authorization": "token {}".format(github_token),
-        "Content-Type": "application/json",
+def create_branch(github_token, repository_name, branch):
+    payload = {
+        "ref": branch.ref,
+        "sha": branch.sha,
     }
+    response = _request(
+        "POST",
+        github_token,
+        "/repos/{}/git/refs".format(repository_name),
+        payload,
+    )
+    return response.status_code
+
+
+def create_tag(github_token, repository_name, tag_name, commit_sha):
     payload = {
-        "ref": commit_ref,
+        "ref": "refs/tags/{}".format(tag_name),
         "sha": commit_sha,
     }
-    response = session.post(
-        "{}/repos/{}/git/refs".format(
-            GITHUB_API_URL,
-            repository_name,
-        ),
-        headers=headers,
-        data=json.dumps(payload),
+    response = _request(
+        "POST",
+        github_token,
+        "/repos/{}/git/refs".format(repository_name),
+        payload,
+    )
+    return response.status_code
+
+
+def merge_branch(
+    github_token, repository_name, dest_branch, source_branch, message
+):
+    payload = {
+        "base": dest_branch,
+        "head": source_branch,
+        "commit_message": message,
+    }
+    response = _request(
+        "POST",
+        github_token,
+        "/repos/{}/merges".format(repository_name),
+        payload,
     )
     return response.status_code
 
 
+def delete_branch(github_token, repository_name, branch):
+    response = _request(
+        "DELETE",
+        github_token,
+        "/repos/{}/git/{}".format(repository_name, branch.ref),
+    )
+    return response.status_code
+
+
+def _errors(response):
+    try:
+        content = response.json()
+
+    except ValueError:
+        content = None
+
+    if not isinstance(content, dict):
+        content = {}
+
+    errors = [
+        error.get("message") or error.get("code")
+        for error in content.get("errors") or []
+        if isinstance(error, dict)
+    ]
+
+    errors = [error for error in errors if error]
+    if not errors:
+        default = "Github error ({}:)".format(response.status_code)
+        errors.append(content.get("message") or default)
+
+    return errors
+
+
+def find_pull_request(github_token, repository_name, branch_name):
+    """Return the open pull request of a head branch, or None"""
+
+    owner = repository_name.split("/")[0]
+    response = _request(
+        "GET",
+        github_token,
+        "/repos/{}/pulls".format(repository_name),
+        params={"state": "open", "head": "{}:{}".format(owner, branch_name)},
+    )
+
+    if response.status_code != 200:
+        return None
+
+    pull_requests = response.json()
+    return pull_requests[0] if pull_requests else None
+
+
+def update_pull_request(github_token, repository_name, pull_request, body):
+    response = _request(
+        "PATCH",
+        github_token,
+        "/repos/{}/pulls/{}".format(repository_name, pull_request["number"]),
+        {"body": body},
+    )
+
+    if response.status_code == 200:
+        return response.status_code, response.json().get("html_url")
+
+    else:
+        return response.status_code, _errors(response)
+
+
 def create_pull_request(
     github_token, repository_name, source_branch, dest_branch, title, body
 ):
-    session = Session()
+    pull_request = find_pull_request(
+        github_token, repository_name, source_branch
+    )
+
+    if pull_request is not None:
+        return update_pull_request(
+            github_token, repository_name, pull_request, body
+        )
 
-    headers = {
-        "Authorization": "token {}".format(github_token),
-        "Content-Type": "application/json",
-    }
     payload = {
         "title": title,
         "body": body,
@@ -78,16 +245,25 @@ def create_pull_request(
         "base": dest_branch,
     }
 
-    response = session.post(
-        "{}/repos/{}/pulls".format(GITHUB_API_URL, repository_name),
-        headers=headers,
-        data=json.dumps(payload),
+    response = _request(
+        "POST",
+        github_token,
+        "/repos/{}/pulls".format(repository_name),
+        payload,
     )
 
     if response.status_code == 201:
         return response.status_code, response.json().get("html_url")
 
-    else:
-        return response.status_code, [
-            _.get("message") for _ in response.json().get("errors")
-        ]
+    # Another run could have opened it since it was looked up.
+    if response.status_code == 422:
+        pull_request = find_pull_request(
+            github_token, repository_name, source_branch
+        )
+
+        if pull_request is not None:
+            return update_pull_request(
+                github_token, repository_name, pull_request, body
+            )
+
+    return response.status_code, _errors(response)
@@ -1,30 +1,54 @@
+import threading
+
 from emoji import emojize
 from termcolor import colored
 
+_stream = None
+_context = threading.local()
+
+
+def redirect(stream):
+    global _stream
+    _stream = stream
+
+
+def prefix(label):
+    _context.prefix = "[{}] ".format(label) if label else ""
+
+
+def _format(message):
+    return "{}{}".format(getattr(_context, "prefix", ""), emojize(message))
+
 
 def log(message):
-    print(emojize(message))
+    print(_format(message), file=_stream)
 
 
 def info(message):
-    print(colored(emojize(message), "blue"))
+    print(colored(_format(message), "blue"), file=_stream)
 
 
 def success(message):
-    print(colored(emojize(message), "green"))
+    print(colored(_format(message), "green"), file=_stream)
 
 
 def warning(message):
-    print(colored(emojize(message), "yellow"))
+    print(colored(_format(message), "yellow"), file=_stream)
 
 
 def error(message):
-    print(colored(emojize(message), "red"))
+    print(colored(_format(message), "red"), file=_stream)
 
 
 def critical(message):
-    print(colored(emojize(message), "grey", "on_red"))
+    print(colored(_format(message), "grey", "on_red"), file=_stream)
 
 
 def question(message):
-    return input(colored(emojize(message), "cyan", attrs=["bold"]))
+    print(
+        colored(_format(message), "cyan", attrs=["bold"]),
+        end="",
+        file=_stream,
+        flush=True,
+    )
+    return input()
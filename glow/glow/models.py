@@ -1,42 +1,190 @@
-class Branch:
-    ...
+import semver
 
 
-class Feature(object):
-    """docstring feature"""
+class Model(object):
+    """Immutable model, attributes are stored in slots"""
 
-    def __init__(self, arg):
-        super(Feature, self).__init__()
-        self.arg = arg
+    __slots__ = ()
 
+    def _set(self, **kwargs):
+        for name, value in kwargs.items():
+            object.__setattr__(self, name, value)
 
-class Release(object):
-    """docstring feature"""
+    def _key(self):
+        return tuple(getattr(self, name) for name in self._fields())
 
-    def __init__(self, arg):
-        super(Feature, self).__init__()
-        self.arg = arg
+    @classmethod
+    def _fields(cls):
+        return [
+            name
+            for klass in reversed(cls.__mro__)
+            for name in getattr(klass, "__slots__", ())
+        ]
 
+    def __setattr__(self, name, value):
+        raise AttributeError("{} is immutable".format(type(self).__name__))
 
-class Hotfix(object):
-    """docstring feature"""
+    def __delattr__(self, name):
+        raise AttributeError("{} is immutable".format(type(self).__name__))
 
-    def __init__(self, arg):
-        super(Feature, self).__init__()
-        self.arg = arg
+    def __eq__(self, other):
+        return type(self) is type(other) and self._key() == other._key()
 
+    def __ne__(self, other):
+        return not self == other
 
-class Version(object):
-    """docstring feature"""
+    def __hash__(self):
+        return hash((type(self), self._key()))
 
-    def __init__(self, arg):
-        super(Feature, self).__init__()
-        self.arg = arg
+    def __repr__(self):
+        return "{}({})".format(
+            type(self).__name__,
+            ", ".join(
+                "{}={!r}".format(name, getattr(self, name))
+                for name in self._fields()
+            ),
+        )
 
 
-class Issue(object):
-    """docstring feature"""
+class Issue(Model):
+    """Jira issue, e.g. PROJ-42, kept exactly as written"""
 
-    def __init__(self, arg):
-        super(Feature, self).__init__()
-        self.arg = arg
+    __slots__ = ("project_key", "id")
+
+    def __init__(self, project_key, issue_id):
+        self._set(project_key=project_key, id=str(issue_id))
+
+    @classmethod
+    def parse(cls, key):
+        project_key, _, issue_id = key.rpartition("-")
+
+        if not project_key or not issue_id.isdigit():
+            raise ValueError("«{}» is not an issue key".format(key))
+
+        return cls(project_key, issue_id)
+
+    @property
+    def key(self):
+        return "{}-{}".format(self.project_key, self.id)
+
+    def __str__(self):
+        return self.key
+
+
+class Version(Model):
+    """Semantic version, optionally read from a tag"""
+
+    __slots__ = ("info", "tag")
+
+    def __init__(self, info, tag=None):
+        self._set(info=info, tag=tag or str(info))
+
+    @classmethod
+    def parse(cls, tag):
+        return cls(semver.VersionInfo.parse(tag), tag)
+
+    def bump_minor(self):
+        return Version(self.info.bump_minor())
+
+    def bump_patch(self):
+        return Version(self.info.bump_patch())
+
+    def _key(self):
+        return (self.info,)
+
+    def __lt__(self, other):
+        return self.info < other.info
+
+    def __str__(self):
+        return str(self.info)
+
+
+class Branch(Model):
+    """Git branch, with the SHA it points to when known"""
+
+    __slots__ = ("name", "sha")
+
+    kind = None
+
+    def __init__(self, name, sha=None):
+        self._set(name=name, sha=sha)
+
+    @staticmethod
+    def parse(name, sha=None):
+        kind, _, suffix = name.partition("/")
+        klass = BRANCH_KINDS.get(kind)
+
+        if klass is not None:
+            try:
+                return klass.from_suffix(suffix, sha)
+
+            except ValueError:
+                pass
+
+        return Branch(name, sha)
+
+    @property
+    def ref(self):
+        return "refs/heads/{}".format(self.name)
+
+    def _arguments(self):
+        return (self.name,)
+
+    def with_sha(self, sha):
+        return type(self)(*self._arguments(), sha=sha)
+
+    def __str__(self):
+        return self.name
+
+
+class Feature(Branch):
+    __slots__ = ("issue",)
+
+    kind = "feature"
+
+    def __init__(self, issue, sha=None):
+        super(Feature, self).__init__("{}/{}".format(self.kind, issue.key), sha)
+        self._set(issue=issue)
+
+    @classmethod
+    def from_suffix(cls, suffix, sha=None):
+        return cls(Issue.parse(suffix), sha)
+
+    @property
+    def title(self):
+        return self.issue.key
+
+    def _arguments(self):
+        return (self.issue,)
+
+
+class Release(Branch):
+    __slots__ = ("version",)
+
+    kind = "release"
+
+    def __init__(self, version, sha=None):
+        super(Release, self).__init__(
+            "{}/{}".format(self.kind, version.tag), sha
+        )
+        self._set(version=version)
+
+    @classmethod
+    def from_suffix(cls, suffix, sha=None):
+        return cls(Version.parse(suffix), sha)
+
+    @property
+    def title(self):
+        return str(self.version)
+
+    def _arguments(self):
+        return (self.version,)
+
+
+class Hotfix(Release):
+    __slots__ = ()
+
+    kind = "hotfix"
+
+
+BRANCH_KINDS = {klass.kind: klass for klass in (Feature, Release, Hotfix)}
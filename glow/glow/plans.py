@@ -0,0 +1,144 @@
+from . import messages
+
+
+class Step(object):
+    """One operation of a plan and its estimated cost"""
+
+    __slots__ = (
+        "kind",
+        "description",
+        "action",
+        "refs",
+        "subprocesses",
+        "round_trips",
+        "read_only",
+    )
+
+    def __init__(
+        self,
+        kind,
+        description,
+        action,
+        refs=(),
+        subprocesses=0,
+        round_trips=0,
+        read_only=False,
+    ):
+        self.kind = kind
+        self.description = description
+        self.action = action
+        self.refs = tuple(refs)
+        self.subprocesses = subprocesses
+        self.round_trips = round_trips
+        self.read_only = read_only
+
+    def as_dict(self):
+        return {
+            "kind": self.kind,
+            "description": self.description,
+            "refs": list(self.refs),
+            "subprocesses": self.subprocesses,
+            "round_trips": self.round_trips,
+            "read_only": self.read_only,
+        }
+
+
+class Plan(object):
+    """Ordered list of operations a flow will perform
+
+    `resolve` maps a ref name to the SHA it currently points to, or None
+    when the ref doesn't exist yet. `stopped_at` is the 1-based index of
+    the step a check found the flow would stop at.
+    """
+
+    def __init__(self, title, resolve=None):
+        self.title = title
+        self.steps = []
+        self.stopped_at = None
+        self._resolve = resolve or (lambda ref: None)
+
+    def add(self, kind, description, action, **kwargs):
+        self.steps.append(Step(kind, description, action, **kwargs))
+        return self
+
+    @property
+    def subprocesses(self):
+        return sum(step.subprocesses for step in self.steps)
+
+    @property
+    def round_trips(self):
+        return sum(step.round_trips for step in self.steps)
+
+    @property
+    def api_calls(self):
+        return sum(
+            step.round_trips for step in self.steps if step.kind == "api"
+        )
+
+    def refs(self):
+        refs = {}
+        for step in self.steps:
+            for ref in step.refs:
+                if ref not in refs:
+                    refs[ref] = self._resolve(ref)
+
+        return refs
+
+    def check(self):
+        """Run the read-only steps, stopping at the first that fails"""
+
+        for index, step in enumerate(self.steps, start=1):
+            if step.read_only and step.action() is False:
+                self.stopped_at = index
+                return False
+
+        return True
+
+    def execute(self):
+        for step in self.steps:
+            if step.action() is False:
+                return False
+
+        return True
+
+    def as_dict(self):
+        return {
+            "title": self.title,
+            "steps": [step.as_dict() for step in self.steps],
+            "subprocesses": self.subprocesses,
+            "round_trips": self.round_trips,
+            "api_calls": self.api_calls,
+            "refs": self.refs(),
+            "stopped_at": self.stopped_at,
+        }
+
+    def report(self):
+        messages.log(":clipboard:  Plan «{}»".format(self.title))
+
+        for index, step in enumerate(self.steps, start=1):
+            messages.log(
+                "  {}. [{}] {} ({} subprocesses, {} round trips)".format(
+                    index,
+                    step.kind,
+                    step.description,
+                    step.subprocesses,
+                    step.round_trips,
+                )
+            )
+
+        messages.info(
+            "Estimated cost: {} subprocesses, {} network round trips "
+            "({} API calls)".format(
+                self.subprocesses, self.round_trips, self.api_calls
+            )
+        )
+
+        for ref, sha in self.refs().items():
+            messages.info("  «{}» {}".format(ref, sha[:7] if sha else "(new)"))
+
+        if self.stopped_at is not None:
+            messages.error(
+                "The flow would stop at step {}: {}".format(
+                    self.stopped_at, self.steps[self.stopped_at - 1].description
+                )
+            )
@@ -0,0 +1,71 @@
+import contextlib
+import json
+import sys
+import time
+
+EXIT_OK = 0
+EXIT_FAILURE = 1
+EXIT_USAGE = 2
+EXIT_ABORTED = 3
+EXIT_CONFIG = 4
+EXIT_NOT_A_REPOSITORY = 5
+EXIT_BRANCH_STATE = 6
+EXIT_REMOTE = 7
+EXIT_GIT = 8
+
+
+class Result(object):
+    """Machine-readable outcome of a glow command"""
+
+    def __init__(self, command=None):
+        self.command = command
+        self.exit_code = None
+        self.errors = []
+        self.data = {}
+        self.timings = {}
+        self._started_at = time.perf_counter()
+
+    @property
+    def succeeded(self):
+        return self.exit_code in (None, EXIT_OK)
+
+    def update(self, **kwargs):
+        self.data.update(kwargs)
+
+    def fail(self, exit_code, message=None):
+        if self.succeeded:
+            self.exit_code = exit_code
+
+        if message:
+            self.errors.append(message)
+
+    def finish(self):
+        if self.exit_code is None:
+            self.exit_code = EXIT_OK
+
+        self.timings["total"] = round(time.perf_counter() - self._started_at, 3)
+
+    @contextlib.contextmanager
+    def timer(self, name):
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round(time.perf_counter() - started_at, 3)
+
+    def as_dict(self):
+        result = {
+            "command": self.command,
+            "status": "success" if self.succeeded else "failure",
+            "exit_code": self.exit_code,
+            "errors": self.errors,
+            "timings": self.timings,
+        }
+        result.update(self.data)
+        return result
+
+    def dump(self, stream=None):
+        stream = stream or sys.stdout
+        json.dump(self.as_dict(), stream, sort_keys=True)
+        stream.write("\n")
+        stream.flush()
@@ -0,0 +1,103 @@
+import os
+
+
+SECTION = "glow"
+
+KEYS = (
+    "github-token",
+    "github-repository-name",
+    "jira-project-key",
+    "main-branch",
+    "develop-branch",
+    "remote-name",
+)
+
+_ESCAPES = {"n": "\n", "t": "\t", "b": "\b", '"': '"', "\\": "\\"}
+
+
+def environment_name(key):
+    return "GLOW_{}".format(key.upper().replace("-", "_"))
+
+
+def _unquote(value):
+    characters = []
+    quoted = False
+    escaped = False
+
+    for character in value:
+        if escaped:
+            characters.append(_ESCAPES.get(character, character))
+            escaped = False
+
+        elif character == "\\":
+            escaped = True
+
+        elif character == '"':
+            quoted = not quoted
+
+        elif character in "#;" and not quoted:
+            break
+
+        else:
+            characters.append(character)
+
+    return "".join(characters).strip()
+
+
+def parse(path):
+    """Return the keys of the [glow] section of a git config file
+
+    Only this section is scanned, other sections and include directives
+    are skipped.
+    """
+
+    values = {}
+    in_section = False
+
+    with open(path, encoding="utf-8") as config_file:
+        for line in config_file:
+            line = line.strip()
+
+            if not line or line[0] in "#;":
+                continue
+
+            if line.startswith("["):
+                header, _, line = line[1:].partition("]")
+                in_section = header.strip().lower() == SECTION
+                line = line.strip()
+
+                if not line:
+                    continue
+
+            if in_section and "=" in line:
+                key, _, value = line.partition("=")
+                values[key.strip().lower()] = _unquote(value)
+
+    return values
+
+
+def read(git_directory):
+    """Return the [glow] section of the repository config"""
+
+    try:
+        return parse(os.path.join(git_directory, "config"))
+
+    except OSError:
+        return {}
+
+
+def load(git_directory, environ=None):
+    """Return glow settings, environment variables override the config"""
+
+    if environ is None:
+        environ = os.environ
+
+    values = {key: value for key, value in read(git_directory).items() if value}
+
+    for key in KEYS:
+        value = environ.get(environment_name(key))
+
+        if value:
+            values[key] = value
+
+    return values
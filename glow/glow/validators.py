@@ -1,6 +1,10 @@
+import inspect
 import sys
 
-from . import messages
+from . import messages, results
+
+
+PLANNABLE_METHODS = ("finish_release", "finish_hotfix")
 
 
 def validate_issue_id(issue_id):
@@ -9,11 +13,11 @@ def validate_issue_id(issue_id):
 
     except ValueError:
         messages.critical('IssueID "{}" is not valid.'.format(issue_id))
-        sys.exit(1)
+        sys.exit(results.EXIT_USAGE)
 
     except TypeError:
         messages.critical("IssueID is not set.")
-        sys.exit(1)
+        sys.exit(results.EXIT_USAGE)
 
     return issue_id
 
@@ -23,4 +27,31 @@ def validate_method_name(method_name, methods_names):
         messages.error(
             "Unknown command «{}»".format(" ".join(method_name.split("_")))
         )
-        sys.exit(1)
+        sys.exit(results.EXIT_USAGE)
+
+
+def validate_arguments(method, arguments):
+    try:
+        inspect.signature(method).bind(*arguments)
+
+    except TypeError:
+        messages.error(
+            "Wrong arguments for «{}»: {}".format(
+                " ".join(method.__name__.split("_")),
+                " ".join(arguments) or "none given",
+            )
+        )
+        sys.exit(results.EXIT_USAGE)
+
+
+def validate_options(method_name, args):
+    if method_name in PLANNABLE_METHODS:
+        return
+
+    for option in ("plan", "remote_only"):
+        if getattr(args, option, False):
+            messages.error(
+                "--{} can only be used with «finish release» "
+                "and «finish hotfix»".format(option.replace("_", "-"))
+            )
+            sys.exit(results.EXIT_USAGE)